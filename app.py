@@ -1,7 +1,19 @@
+import sys
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 
+# Pipeline modules live in src/ and are run as scripts, so import them flat
+sys.path.append(str(Path(__file__).resolve().parent / "src"))
+
+from patrol_allocation import (
+    SHIFT_NAMES, assign_shift, demand_matrix, allocate_units, split_units
+)
+from snapshot_store import SnapshotManager
+from block_risk import BlockRiskIndex
+
 # =================================================
 # PAGE CONFIG
 # =================================================
@@ -37,28 +49,70 @@ temporal_cluster_names = {
 # =================================================
 # DATA LOADING
 # =================================================
-@st.cache_data
-def load_data():
-    geo = pd.read_csv("data/processed/chicago_crime_geo_clustered.csv")
-    temporal = pd.read_csv("data/processed/chicago_crime_temporal_clustered.csv")
-    pca = pd.read_csv("data/processed/pca_components.csv")
-
-    try:
-        tsne = pd.read_csv("data/processed/tsne_components.csv")
-    except FileNotFoundError:
-        tsne = None
-
-    try:
-        pca_importance = pd.read_csv(
-            "data/processed/pca_feature_importance.csv"
+def read_outputs(directory: str) -> dict:
+    """
+    Load every dashboard input from one snapshot (or processed) directory.
+    """
+    base = Path(directory)
+
+    def read_optional(name, **kwargs):
+        try:
+            return pd.read_csv(base / name, **kwargs)
+        except FileNotFoundError:
+            return None
+
+    block_index_path = base / "block_risk_index.npz"
+
+    return {
+        "geo": pd.read_csv(base / "chicago_crime_geo_clustered.csv"),
+        "temporal": pd.read_csv(base / "chicago_crime_temporal_clustered.csv"),
+        "pca": pd.read_csv(base / "pca_components.csv"),
+        "tsne": read_optional("tsne_components.csv"),
+        "pca_importance": read_optional("pca_feature_importance.csv"),
+        "trajectories": read_optional(
+            "hotspot_trajectories.csv", parse_dates=["Window_Start"]
+        ),
+        "forecast_cells": read_optional("hotspot_forecast_cells.csv"),
+        "forecast_hourly": read_optional("hotspot_forecast_hourly.csv"),
+        "block_risk": (
+            BlockRiskIndex.load(block_index_path) if block_index_path.exists() else None
         )
-    except FileNotFoundError:
-        pca_importance = None
+    }
+
+
+@st.cache_resource
+def get_snapshot_manager():
+    # Shared by all sessions; new snapshots are preloaded in the background
+    return SnapshotManager(read_outputs)
+
 
-    return geo, temporal, pca, tsne, pca_importance
+# One snapshot per script run, so a swap never mixes data mid-render
+snapshot = get_snapshot_manager().current()
 
+geo_df = snapshot.data["geo"]
+temporal_df = snapshot.data["temporal"]
+pca_df = snapshot.data["pca"]
+tsne_df = snapshot.data["tsne"]
+pca_importance_df = snapshot.data["pca_importance"]
 
-geo_df, temporal_df, pca_df, tsne_df, pca_importance_df = load_data()
+
+@st.cache_data(max_entries=4)
+def load_demand(version: str, shift_axis: str, _data: dict) -> pd.DataFrame:
+    geo_df, temporal_df = _data["geo"], _data["temporal"]
+    df = geo_df[["Date", "Hour", "Geo_Cluster", "Crime_Severity_Score"]].copy()
+    df["Date"] = pd.to_datetime(df["Date"])
+
+    if shift_axis == "Temporal clusters" and len(temporal_df) == len(df):
+        df["Shift"] = temporal_df["Temporal_Cluster"].to_numpy()
+        demand = demand_matrix(df)
+        demand.columns = [temporal_cluster_names.get(c, f"Cluster {c}") for c in demand.columns]
+    else:
+        df["Shift"] = assign_shift(df["Hour"])
+        demand = demand_matrix(df)
+        demand.columns = [SHIFT_NAMES[c] for c in demand.columns]
+
+    demand.index = [geo_cluster_names.get(z, f"Cluster {z}") for z in demand.index]
+    return demand
 
 # =================================================
 # SIDEBAR NAVIGATION
@@ -71,11 +125,15 @@ page = st.sidebar.radio(
         "EDA",
         "Geographic Hotspots",
         "Temporal Patterns",
+        "Hotspot Evolution",
+        "Next-Week Forecast",
         "PCA Analysis",
         "t-SNE Visualization",
+        "Patrol What-if",
         "MLflow Metrics"
     ]
 )
+st.sidebar.caption(f"📦 Data snapshot: {snapshot.version}")
 
 # =================================================
 # OVERVIEW PAGE
@@ -166,9 +224,24 @@ elif page == "Geographic Hotspots":
 
     st.info(
         "📌 **Operational Insight:** Increase patrol presence in this zone "
-        "during peak hours to reduce response time and crime intensity."
+        "during peak hours to reduce response time and crime intensity. "
+        "Use the **Patrol What-if** page to size the deployment."
     )
 
+    st.markdown("### 🏘️ Hottest Blocks Right Now")
+    block_risk = snapshot.data["block_risk"]
+    if block_risk is None:
+        st.warning(
+            "Block risk index not found. Please run `block_risk.py`."
+        )
+    else:
+        k = st.slider("Number of blocks", min_value=10, max_value=200, value=50, step=10)
+        st.caption(
+            f"Severity-weighted incidents, decayed with a "
+            f"{block_risk.half_life_days:g}-day half-life"
+        )
+        st.dataframe(block_risk.top_k(k), hide_index=True)
+
 # =================================================
 # TEMPORAL PATTERNS
 # =================================================
@@ -200,6 +273,105 @@ elif page == "Temporal Patterns":
         "based on this recurring crime pattern."
     )
 
+# =================================================
+# HOTSPOT EVOLUTION
+# =================================================
+elif page == "Hotspot Evolution":
+    st.subheader("🧭 Hotspot Evolution Over Time")
+
+    trajectories = snapshot.data["trajectories"]
+    if trajectories is None:
+        st.warning(
+            "Trajectory data not found. Please run `hotspot_backfill.py`."
+        )
+    else:
+        freq = st.radio(
+            "Window size", sorted(trajectories["Window_Freq"].unique()), horizontal=True
+        )
+        geo = trajectories[
+            (trajectories["Model"] == "geo") & (trajectories["Window_Freq"] == freq)
+        ]
+
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for hotspot, path in geo.groupby("Hotspot_ID"):
+            ax.plot(
+                path["Longitude"], path["Latitude"], marker=".", label=f"Hotspot {hotspot}"
+            )
+            ax.scatter(
+                path["Longitude"].iloc[-1], path["Latitude"].iloc[-1], s=60, marker="X"
+            )
+        ax.set_title("Hotspot Centroid Trajectories (X = latest window)")
+        ax.set_xlabel("Longitude")
+        ax.set_ylabel("Latitude")
+        ax.legend(fontsize=8)
+        st.pyplot(fig)
+
+        st.markdown("### 📈 Incidents per Hotspot")
+        volume = geo.pivot(index="Window_Start", columns="Hotspot_ID", values="Incidents")
+        volume.columns = [f"Hotspot {c}" for c in volume.columns]
+        st.line_chart(volume)
+
+        st.info(
+            "📌 **Operational Insight:** Hotspots whose centroid keeps moving "
+            "or whose volume is rising need patrol zones redrawn, not just "
+            "more units."
+        )
+
+# =================================================
+# NEXT-WEEK FORECAST
+# =================================================
+elif page == "Next-Week Forecast":
+    st.subheader("🔮 Next-Week Hotspot Forecast")
+
+    cells = snapshot.data["forecast_cells"]
+    hourly = snapshot.data["forecast_hourly"]
+    if cells is None or hourly is None:
+        st.warning(
+            "Forecast data not found. Please run `hotspot_forecast.py`."
+        )
+    else:
+        st.caption(f"Forecast week starting {cells['Forecast_Start'].iloc[0]}")
+
+        col1, col2 = st.columns(2)
+        col1.metric("Expected Incidents Next Day", f"{cells['Expected_Next_Day'].sum():,.0f}")
+        col2.metric("Expected Incidents Next Week", f"{cells['Expected_Next_Week'].sum():,.0f}")
+
+        fig, ax = plt.subplots(figsize=(10, 6))
+        scatter = ax.scatter(
+            cells["Longitude"],
+            cells["Latitude"],
+            c=cells["Expected_Severity_Next_Week"],
+            cmap="inferno_r",
+            s=8
+        )
+        fig.colorbar(scatter, ax=ax, label="Expected severity-weighted incidents")
+        ax.set_title("Expected Risk per Cell – Next Week")
+        ax.set_xlabel("Longitude")
+        ax.set_ylabel("Latitude")
+        st.pyplot(fig)
+
+        st.markdown("### 🔥 Highest-Risk Cells")
+        top = cells.head(20)
+        st.dataframe(top[[
+            "Cell", "Latitude", "Longitude", "Expected_Next_Day",
+            "Expected_Next_Week", "Expected_Severity_Next_Week"
+        ]])
+
+        selected_cell = st.selectbox("Hour-of-week profile for cell", top["Cell"])
+        profile = hourly[hourly["Cell"] == selected_cell].pivot(
+            index="Hour", columns="Day_of_Week", values="Expected_Incidents"
+        )
+        day_order = [
+            "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+        ]
+        st.line_chart(profile[[d for d in day_order if d in profile.columns]])
+
+        st.info(
+            "📌 **Operational Insight:** Cells at the top of this table are where "
+            "next week's incidents are expected; pair them with the hours where "
+            "their profile peaks when planning patrols."
+        )
+
 # =================================================
 # PCA ANALYSIS
 # =================================================
@@ -245,6 +417,71 @@ elif page == "t-SNE Visualization":
 
         st.pyplot(fig)
 
+# =================================================
+# PATROL WHAT-IF
+# =================================================
+elif page == "Patrol What-if":
+    st.subheader("🚔 Patrol Allocation What-if")
+
+    shift_axis = st.radio(
+        "Shift definition",
+        ["Patrol watches (8h)", "Temporal clusters"],
+        horizontal=True
+    )
+    demand = load_demand(snapshot.version, shift_axis, snapshot.data)
+    shifts = list(demand.columns)
+
+    col1, col2, col3 = st.columns(3)
+    n_units = col1.slider("Available patrol units", 5, 500, 120, step=5)
+    min_units = col2.slider("Minimum units per zone & shift", 0, 10, 1)
+    max_units = col3.slider("Maximum units per zone & shift", 1, 100, 40)
+    effectiveness = st.slider(
+        "Share of remaining risk each extra unit covers", 0.05, 0.9, 0.3, step=0.05
+    )
+
+    st.markdown("#### Share of units per shift")
+    share_cols = st.columns(len(shifts))
+    shares = [
+        share_cols[i].number_input(name, 0.0, 100.0, round(100 / len(shifts), 1), step=5.0)
+        for i, name in enumerate(shifts)
+    ]
+
+    if sum(shares) == 0:
+        st.warning("Give at least one shift a non-zero share of units.")
+    else:
+        units_per_shift = split_units(n_units, shares)
+        try:
+            allocation, covered, unassigned = allocate_units(
+                demand.to_numpy(), units_per_shift,
+                min_units=min_units, max_units=max(max_units, min_units),
+                effectiveness=effectiveness
+            )
+        except ValueError as err:
+            st.error(f"⚠️ {err}. Lower the per-zone minimum or add units.")
+        else:
+            allocation_df = pd.DataFrame(allocation, index=demand.index, columns=shifts)
+
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Units deployed", f"{int(allocation.sum())}")
+            m2.metric(
+                "Demand covered",
+                f"{covered.sum() / demand.to_numpy().sum() * 100:.1f}%"
+            )
+            m3.metric("Units left unassigned", f"{int(unassigned.sum())}")
+
+            st.markdown("### 🗺️ Recommended units per zone & shift")
+            st.dataframe(allocation_df)
+
+            allocation_df.plot(kind="bar", stacked=True, figsize=(10, 4))
+            plt.ylabel("Patrol Units")
+            plt.xticks(rotation=30, ha="right")
+            plt.tight_layout()
+            st.pyplot(plt.gcf())
+            plt.clf()
+
+            st.markdown("### 📊 Severity-weighted incidents per day")
+            st.dataframe(demand.round(2))
+
 # =================================================
 # MLFLOW METRICS
 # =================================================
@@ -1,6 +1,193 @@
+import zlib
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from near_repeat import project_to_meters
+
+
+NEAR_DUPLICATE_CONFIG = {
+    "enabled": True,
+    "max_minutes": 30,        # reports this close in time can be the same event
+    "max_meters": 150,
+    "min_similarity": 0.8,    # estimated Jaccard of the text shingles
+    "num_perm": 32,
+    "bands": 8,               # LSH bands of num_perm / bands rows each
+    "max_neighbours": 50,     # candidates per report within one LSH block
+    "action": "drop"          # "drop" keeps the earliest report, "flag" keeps all
+}
+# Compared fuzzily; Primary Type and Block must match exactly
+NEAR_DUPLICATE_TEXT_FIELDS = ["Description", "Location Description"]
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+
+
+def minhash_signatures(texts, num_perm: int, seed: int = 42) -> np.ndarray:
+    """
+    MinHash signature of the character 3-gram set of each text.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 31, num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 31, num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    for row, text in enumerate(texts):
+        shingles = {text[i:i + 3] for i in range(max(len(text) - 2, 1))}
+        x = np.fromiter(
+            (zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        # a < 2**31 and x < 2**32, so a*x + b cannot overflow uint64
+        signatures[row] = ((x[:, None] * a + b) % _MERSENNE_PRIME).min(axis=0)
+    return signatures
+
+
+def row_signatures(df: pd.DataFrame, fields: list, num_perm: int) -> np.ndarray:
+    """
+    Per-row MinHash over the union of the fields' shingles.
+
+    MinHash of a union is the element-wise minimum of the parts, so each
+    distinct field value is hashed only once. Each field gets its own hash
+    seed, which keeps equal shingles in different fields apart.
+    """
+    signature = None
+    for salt, field in enumerate(fields):
+        codes, uniques = pd.factorize(df[field].astype(str))
+        field_sig = minhash_signatures(list(uniques), num_perm, seed=42 + salt)[codes]
+        signature = field_sig if signature is None else np.minimum(signature, field_sig)
+    return signature
+
+
+def _pairs_within_window(keys: np.ndarray, t: np.ndarray, max_gap: int, max_neighbours: int):
+    """
+    Index pairs (i, j) that share a key and are at most `max_gap` apart in time.
+
+    Rows are swept in (key, time) order and each is compared only with the
+    next `max_neighbours` rows, so a huge block of identical keys costs
+    O(rows × max_neighbours) instead of every pair in the block.
+    """
+    order = np.lexsort((t, keys))
+    sorted_keys, sorted_t = keys[order], t[order]
+    pair_i, pair_j = [], []
+    for offset in range(1, min(max_neighbours, len(keys) - 1) + 1):
+        close = (
+            (sorted_keys[offset:] == sorted_keys[:-offset]) &
+            (sorted_t[offset:] - sorted_t[:-offset] <= max_gap)
+        )
+        # Further offsets are only further apart in time
+        if not close.any():
+            break
+        pos = np.flatnonzero(close)
+        pair_i.append(order[pos])
+        pair_j.append(order[pos + offset])
+    if not pair_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(pair_i), np.concatenate(pair_j)
+
+
+def _unique_pairs(pair_i: list, pair_j: list, n: int):
+    if not pair_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    i = np.concatenate(pair_i)
+    j = np.concatenate(pair_j)
+    unique_pairs = np.unique(np.minimum(i, j) * n + np.maximum(i, j))
+    return unique_pairs // n, unique_pairs % n
+
+
+def _anchor_duplicates(i: np.ndarray, j: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    """
+    Row of the original each row repeats (itself for originals).
+
+    Rows are visited in `rank` order and a row repeats the earliest
+    matching report that is itself an original, so every duplicate is
+    within the limits of its original and matches never chain.
+    """
+    earlier = np.where(rank[i] < rank[j], i, j)
+    later = np.where(rank[i] < rank[j], j, i)
+    order = np.lexsort((rank[earlier], rank[later]))
+
+    anchor = list(range(len(rank)))
+    for e, l in zip(earlier[order].tolist(), later[order].tolist()):
+        if anchor[l] == l and anchor[e] == e:
+            anchor[l] = e
+    return np.array(anchor, dtype=np.int64)
+
+
+def find_near_duplicates(df: pd.DataFrame, config: dict) -> np.ndarray:
+    """
+    ID of the earliest report each near-duplicate repeats (NaN for originals).
+
+    Candidates are blocked on Primary Type, Block, a spatial cell and a
+    time bucket, then on LSH bands of the text MinHash; only those candidates
+    are verified on time gap, distance and signature similarity. A
+    duplicate is always within the limits of the report it repeats.
+    """
+    n = len(df)
+    rows_per_band = config["num_perm"] // config["bands"]
+    signatures = row_signatures(df, NEAR_DUPLICATE_TEXT_FIELDS, config["num_perm"])
+
+    x, y = project_to_meters(
+        df["Latitude"].to_numpy(dtype=float), df["Longitude"].to_numpy(dtype=float)
+    )
+    t_minutes = df["Date"].to_numpy(dtype="datetime64[m]").astype(np.int64)
+    cell = 2 * config["max_meters"]
+    bucket = 2 * config["max_minutes"]
+
+    type_codes = pd.factorize(df["Primary Type"])[0]
+    block_codes = pd.factorize(df["Block"])[0]
+    band_hashes = []
+    for band in range(config["bands"]):
+        band_sig = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        band_hash = band_sig[:, 0].copy()
+        for col in range(1, rows_per_band):
+            band_hash = band_hash * np.uint64(1_000_003) + band_sig[:, col]
+        band_hashes.append(band_hash * np.uint64(2 * band + 1))
+
+    # Half-cell offsets on each axis: any two reports within half a cell
+    # (and half a bucket) share a block in at least one of the 8 grids
+    grid_i, grid_j = [], []
+    for sx, sy, st in np.ndindex(2, 2, 2):
+        block_hash = pd.util.hash_pandas_object(pd.DataFrame({
+            "type": type_codes,
+            "block": block_codes,
+            "cx": np.floor(x / cell + sx / 2).astype(np.int64),
+            "cy": np.floor(y / cell + sy / 2).astype(np.int64),
+            "bucket": (t_minutes + st * bucket // 2) // bucket
+        }), index=False).to_numpy()
+
+        pair_i, pair_j = [], []
+        for band_hash in band_hashes:
+            i, j = _pairs_within_window(
+                block_hash ^ band_hash, t_minutes,
+                config["max_minutes"], config["max_neighbours"]
+            )
+            pair_i.append(i)
+            pair_j.append(j)
+
+        i, j = _unique_pairs(pair_i, pair_j, n)
+        grid_i.append(i)
+        grid_j.append(j)
+
+    i, j = _unique_pairs(grid_i, grid_j, n)
+
+    similarity = (signatures[i] == signatures[j]).mean(axis=1)
+    keep = (
+        (type_codes[i] == type_codes[j]) &
+        (block_codes[i] == block_codes[j]) &
+        (np.abs(t_minutes[i] - t_minutes[j]) <= config["max_minutes"]) &
+        (np.hypot(x[i] - x[j], y[i] - y[j]) <= config["max_meters"]) &
+        (similarity >= config["min_similarity"])
+    )
+
+    # Earliest report (then lowest ID) first
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.lexsort((df["ID"].to_numpy(), t_minutes))] = np.arange(n)
+    canonical_row = _anchor_duplicates(i[keep], j[keep], rank)
+
+    duplicate_of = np.full(n, np.nan)
+    is_dup = canonical_row != np.arange(n)
+    duplicate_of[is_dup] = df["ID"].to_numpy()[canonical_row[is_dup]]
+    return duplicate_of
+
 
 def main():
     INPUT_PATH = "data/sampled/chicago_crime_500k.csv"
@@ -57,6 +244,21 @@ def main():
         if col in df.columns:
             df[col] = df[col].fillna("UNKNOWN")
 
+    # -----------------------------
+    # Near-duplicate reports
+    # -----------------------------
+    if NEAR_DUPLICATE_CONFIG["enabled"]:
+        print("🧹 Detecting near-duplicate reports (MinHash LSH)...")
+        df = df.reset_index(drop=True)
+        duplicate_of = find_near_duplicates(df, NEAR_DUPLICATE_CONFIG)
+        n_dups = int(np.count_nonzero(~np.isnan(duplicate_of)))
+        print(f"   ↳ {n_dups:,} near-duplicate reports found")
+
+        if NEAR_DUPLICATE_CONFIG["action"] == "drop":
+            df = df[np.isnan(duplicate_of)]
+        else:
+            df["Duplicate_Of"] = pd.array(duplicate_of, dtype="Int64")
+
     print(f"✅ Final cleaned shape: {df.shape}")
 
     # Save cleaned data
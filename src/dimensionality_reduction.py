@@ -3,14 +3,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
-from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.manifold import TSNE
 
+from feature_store import MATRICES, load_matrix
 
-def main():
-    INPUT_PATH = "data/processed/chicago_crime_geo_clustered.csv"
 
+def main():
     PCA_OUTPUT = "data/processed/pca_components.csv"
     TSNE_OUTPUT = "data/processed/tsne_components.csv"
     FEATURE_IMPORTANCE_OUTPUT = "data/processed/pca_feature_importance.csv"
@@ -18,28 +17,12 @@ def main():
     Path("outputs").mkdir(exist_ok=True)
     Path("data/processed").mkdir(exist_ok=True)
 
-    print("📥 Loading clustered dataset...")
-    df = pd.read_csv(INPUT_PATH)
-
-    # -----------------------------
-    # Select numerical features
-    # -----------------------------
-    features = [
-        "Latitude",
-        "Longitude",
-        "Hour",
-        "Month",
-        "Is_Weekend",
-        "Crime_Severity_Score"
-    ]
-
-    X = df[features].dropna()
-
     # -----------------------------
-    # Scale
+    # Scaled numerical features (shared feature store)
     # -----------------------------
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    print("📥 Opening scaled feature matrix...")
+    features = MATRICES["pca"]
+    X_scaled = load_matrix("pca").X
 
     # -----------------------------
     # PCA (variance analysis)
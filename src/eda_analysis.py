@@ -1,15 +1,33 @@
+import json
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+
+def load_counts(summary_path: str, cleaned_path: str) -> dict:
+    """
+    Value counts for the EDA charts, preferring the streaming profile summary.
+    """
+    if Path(summary_path).exists():
+        print(f"📥 Reading streaming summary: {summary_path}")
+        with open(summary_path) as f:
+            exact = json.load(f)["exact_counts"]
+        return {col: pd.Series(exact[col]) for col in ["Primary Type", "Arrest", "Domestic"]}
+
+    print(f"📥 Summary not found, reading {cleaned_path}")
+    df = pd.read_csv(cleaned_path, usecols=["Primary Type", "Arrest", "Domestic"])
+    return {col: df[col].value_counts() for col in df.columns}
+
+
 def main():
     INPUT_PATH = "data/processed/chicago_crime_cleaned.csv"
+    SUMMARY_PATH = "data/processed/eda_summary.json"
     Path("outputs").mkdir(exist_ok=True)
 
-    df = pd.read_csv(INPUT_PATH)
+    counts = load_counts(SUMMARY_PATH, INPUT_PATH)
 
     # Crime Type Distribution
-    crime_counts = df["Primary Type"].value_counts().head(10)
+    crime_counts = counts["Primary Type"].sort_values(ascending=False).head(10)
     crime_counts.plot(kind="bar", title="Top 10 Crime Types")
     plt.ylabel("Number of Crimes")
     plt.tight_layout()
@@ -17,7 +35,7 @@ def main():
     plt.close()
 
     # Arrest vs Non-Arrest
-    df["Arrest"].value_counts().plot(
+    counts["Arrest"].plot(
         kind="pie",
         autopct="%1.1f%%",
         title="Arrest vs Non-Arrest"
@@ -27,7 +45,7 @@ def main():
     plt.close()
 
     # Domestic vs Non-Domestic
-    df["Domestic"].value_counts().plot(
+    counts["Domestic"].plot(
         kind="bar",
         title="Domestic vs Non-Domestic Crimes"
     )
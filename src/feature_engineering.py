@@ -1,5 +1,31 @@
+import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.path import Path as PolygonPath
+
+
+# Output column -> (boundary GeoJSON, feature property holding the unit id)
+BOUNDARY_LAYERS = {
+    "Geo_Beat": ("data/boundaries/police_beats.geojson", "beat_num"),
+    "Geo_District": ("data/boundaries/police_districts.geojson", "dist_num"),
+    "Geo_Community_Area": ("data/boundaries/community_areas.geojson", "area_numbe")
+}
+
+# Primary Type -> severity score (unlisted types score 1)
+SEVERITY_MAP = {
+    "HOMICIDE": 5,
+    "KIDNAPPING": 5,
+    "CRIM SEXUAL ASSAULT": 5,
+    "ROBBERY": 4,
+    "ASSAULT": 4,
+    "BATTERY": 4,
+    "BURGLARY": 3,
+    "MOTOR VEHICLE THEFT": 3,
+    "THEFT": 2,
+    "CRIMINAL DAMAGE": 2
+}
 
 
 def assign_season(month: int) -> str:
@@ -13,6 +39,108 @@ def assign_season(month: int) -> str:
         return "Fall"
 
 
+def load_boundaries(path: str, id_property: str) -> list:
+    """
+    Load boundary polygons as (unit_id, bbox, [(exterior, holes), ...]).
+    """
+    with open(path) as f:
+        features = json.load(f)["features"]
+
+    units = []
+    for feature in features:
+        geometry = feature["geometry"]
+        polygons = geometry["coordinates"]
+        if geometry["type"] == "Polygon":
+            polygons = [polygons]
+
+        parts = []
+        for rings in polygons:
+            exterior = PolygonPath(np.asarray(rings[0], dtype=float)[:, :2])
+            holes = [PolygonPath(np.asarray(r, dtype=float)[:, :2]) for r in rings[1:]]
+            parts.append((exterior, holes))
+
+        vertices = np.vstack([ext.vertices for ext, _ in parts])
+        bbox = np.r_[vertices.min(axis=0), vertices.max(axis=0)]
+        units.append((str(feature["properties"][id_property]), bbox, parts))
+
+    return units
+
+
+def points_in_units(lon: np.ndarray, lat: np.ndarray, units: list) -> np.ndarray:
+    """
+    Index of the containing unit for every point (-1 when outside all units).
+
+    Points are sorted by longitude once, so each polygon's bounding box
+    selects its candidates with a binary search before the exact test.
+    """
+    codes = np.full(len(lon), -1, dtype=np.int32)
+    order = np.argsort(lon, kind="stable")
+    lon_sorted = lon[order]
+
+    for code, (_, bbox, parts) in enumerate(units):
+        lo, hi = np.searchsorted(lon_sorted, [bbox[0], bbox[2]], side="left")
+        candidates = order[lo:hi]
+        candidates = candidates[
+            (lat[candidates] >= bbox[1]) &
+            (lat[candidates] <= bbox[3]) &
+            (codes[candidates] == -1)
+        ]
+        if len(candidates) == 0:
+            continue
+
+        xy = np.column_stack([lon[candidates], lat[candidates]])
+        inside = np.zeros(len(candidates), dtype=bool)
+        for exterior, holes in parts:
+            in_part = exterior.contains_points(xy)
+            for hole in holes:
+                in_part &= ~hole.contains_points(xy)
+            inside |= in_part
+
+        codes[candidates[inside]] = code
+
+    return codes
+
+
+_WORKER_LAYERS = {}
+
+
+def _init_worker(layers):
+    _WORKER_LAYERS.update(layers)
+
+
+def _tag_batch(lon, lat):
+    return {
+        col: points_in_units(lon, lat, units)
+        for col, units in _WORKER_LAYERS.items()
+    }
+
+
+def assign_admin_units(df: pd.DataFrame, layers: dict,
+                       batch_size: int = 250_000, n_jobs: int = 4) -> pd.DataFrame:
+    """
+    Tag every incident with its beat, district and community area polygons.
+    """
+    lon = df["Longitude"].to_numpy(dtype=float)
+    lat = df["Latitude"].to_numpy(dtype=float)
+    starts = range(0, len(df), batch_size)
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=_init_worker, initargs=(layers,)
+    ) as pool:
+        futures = [
+            pool.submit(_tag_batch, lon[i:i + batch_size], lat[i:i + batch_size])
+            for i in starts
+        ]
+        results = [f.result() for f in futures]
+
+    for col, units in layers.items():
+        codes = np.concatenate([r[col] for r in results])
+        unit_ids = np.array([unit_id for unit_id, _, _ in units] + [None], dtype=object)
+        df[col] = unit_ids[codes]
+
+    return df
+
+
 def main():
     INPUT_PATH = "data/processed/chicago_crime_cleaned.csv"
     OUTPUT_PATH = "data/processed/chicago_crime_features.csv"
@@ -36,27 +164,30 @@ def main():
     # Crime Severity Score
     # -----------------------------
     print("⚠️ Assigning crime severity scores...")
-    severity_map = {
-        "HOMICIDE": 5,
-        "KIDNAPPING": 5,
-        "CRIM SEXUAL ASSAULT": 5,
-        "ROBBERY": 4,
-        "ASSAULT": 4,
-        "BATTERY": 4,
-        "BURGLARY": 3,
-        "MOTOR VEHICLE THEFT": 3,
-        "THEFT": 2,
-        "CRIMINAL DAMAGE": 2
-    }
-
     df["Crime_Severity_Score"] = (
         df["Primary Type"]
         .str.upper()
-        .map(severity_map)
+        .map(SEVERITY_MAP)
         .fillna(1)
         .astype(int)
     )
 
+    # -----------------------------
+    # Administrative Units
+    # -----------------------------
+    layers = {
+        col: load_boundaries(path, id_property)
+        for col, (path, id_property) in BOUNDARY_LAYERS.items()
+        if Path(path).exists()
+    }
+    if layers:
+        print(f"🗺️ Assigning incidents to {', '.join(layers)}...")
+        df = assign_admin_units(df, layers)
+        for col in layers:
+            print(f"   ↳ {col}: {df[col].notna().mean() * 100:.2f}% matched")
+    else:
+        print("⚠️ No boundary files in data/boundaries, skipping unit enrichment")
+
     print(f"✅ Feature engineered shape: {df.shape}")
 
     # Save output
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+
+SOURCE_PATH = "data/processed/chicago_crime_features.csv"
+STORE_DIR = "data/features"
+
+# Named standardized matrices shared by the modeling stages
+MATRICES = {
+    "geo": ["Latitude", "Longitude"],
+    "temporal": ["Hour", "Month", "Is_Weekend"],
+    "pca": [
+        "Latitude",
+        "Longitude",
+        "Hour",
+        "Month",
+        "Is_Weekend",
+        "Crime_Severity_Score"
+    ]
+}
+
+
+class FeatureMatrix:
+    """
+    Read-only view of a stored matrix.
+
+    `X` is a float32 memory map, `rows` maps each matrix row to its row
+    position in the source CSV and `ids` to its crime ID. Pickling only
+    sends the location, so process-pool workers re-open the same pages
+    instead of receiving a copy.
+    """
+
+    def __init__(self, directory: str, name: str):
+        self.directory = str(directory)
+        self.name = name
+
+        base = Path(directory)
+        with open(base / f"{name}.json") as f:
+            meta = json.load(f)
+
+        self.columns = meta["columns"]
+        self.version = meta["version"]
+        self.mean = np.asarray(meta["mean"])
+        self.scale = np.asarray(meta["scale"])
+        self.X = np.load(base / f"{name}.npy", mmap_mode="r")
+        self.rows = np.load(base / f"{name}_rows.npy", mmap_mode="r")
+        ids_path = base / f"{name}_ids.npy"
+        self.ids = np.load(ids_path, mmap_mode="r") if ids_path.exists() else None
+
+    def __reduce__(self):
+        return FeatureMatrix, (self.directory, self.name)
+
+    def __len__(self):
+        return len(self.X)
+
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(X) * self.scale + self.mean
+
+
+def data_version(source: str = SOURCE_PATH) -> str:
+    """
+    Version key for the source file: changes whenever it is rewritten.
+    """
+    stat = os.stat(source)
+    key = f"{Path(source).resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{json.dumps(MATRICES)}"
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+def _write_matrix(directory: Path, name: str, df: pd.DataFrame, version: str):
+    columns = MATRICES[name]
+    valid = df[columns].notna().all(axis=1).to_numpy()
+    values = df.loc[valid, columns].to_numpy(dtype=np.float64)
+
+    # Same statistics as StandardScaler (population std, zero scale -> 1)
+    mean = values.mean(axis=0)
+    scale = values.std(axis=0)
+    scale[scale == 0] = 1.0
+    X = np.ascontiguousarray((values - mean) / scale, dtype=np.float32)
+
+    np.save(directory / f"{name}.npy", X)
+    np.save(directory / f"{name}_rows.npy", np.flatnonzero(valid))
+    if "ID" in df.columns:
+        np.save(directory / f"{name}_ids.npy", df.loc[valid, "ID"].to_numpy(dtype=np.int64))
+
+    with open(directory / f"{name}.json", "w") as f:
+        json.dump({
+            "name": name,
+            "columns": columns,
+            "version": version,
+            "n_rows": len(X),
+            "mean": mean.tolist(),
+            "scale": scale.tolist()
+        }, f, indent=2)
+
+
+def prune_versions(store_dir: str = STORE_DIR, current: Path = None, keep: int = 2):
+    """
+    Remove all but the `keep` most recently built versions (always keeping `current`).
+    """
+    versions = sorted(
+        (p for p in Path(store_dir).iterdir() if p.is_dir() and not p.name.startswith(".")),
+        key=lambda p: p.stat().st_mtime_ns
+    )
+    for old in versions[:-keep]:
+        if current is None or old.resolve() != Path(current).resolve():
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def build_matrices(source: str = SOURCE_PATH, store_dir: str = STORE_DIR,
+                   keep: int = 2) -> Path:
+    """
+    Parse the source once and write every named matrix for its data version.
+
+    After publishing a new version, older ones are pruned so the store
+    keeps at most `keep` versions on disk.
+    """
+    version = data_version(source)
+    target = Path(store_dir) / version
+    if target.exists():
+        return target
+
+    usecols = sorted({c for cols in MATRICES.values() for c in cols} | {"ID"})
+    df = pd.read_csv(source, usecols=lambda c: c in usecols)
+
+    # Build in a scratch directory and rename, so readers never see a partial store
+    scratch = Path(store_dir) / f".{version}.{os.getpid()}.tmp"
+    scratch.mkdir(parents=True, exist_ok=True)
+    for name in MATRICES:
+        _write_matrix(scratch, name, df, version)
+
+    try:
+        os.rename(scratch, target)
+    except OSError:
+        # Another process published the same version first
+        for f in scratch.iterdir():
+            f.unlink()
+        scratch.rmdir()
+    else:
+        # Open memory maps of pruned versions stay valid until closed
+        prune_versions(store_dir, current=target, keep=keep)
+
+    return target
+
+
+def load_matrix(name: str, source: str = SOURCE_PATH,
+                store_dir: str = STORE_DIR) -> FeatureMatrix:
+    """
+    Open a named matrix read-only, building the store for this data version if needed.
+    """
+    return FeatureMatrix(build_matrices(source, store_dir), name)
+
+
+def main():
+    print(f"📥 Building feature-matrix store from {SOURCE_PATH}...")
+    directory = build_matrices()
+
+    for name in MATRICES:
+        matrix = FeatureMatrix(directory, name)
+        print(f"   ↳ {name}: {matrix.X.shape[0]:,} × {matrix.X.shape[1]} float32")
+
+    print("💾 Feature store ready")
+    print(f"📁 Output: {directory}")
+
+
+if __name__ == "__main__":
+    main()
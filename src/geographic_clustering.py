@@ -1,29 +1,145 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 from sklearn.cluster import MiniBatchKMeans, DBSCAN
-from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import silhouette_score, davies_bouldin_score
 from scipy.cluster.hierarchy import dendrogram, linkage
 
+from feature_store import FeatureMatrix, load_matrix
+
+
+# Column to partition on for per-type hotspots ("Crime_Severity_Score" for
+# severity tiers); set to None to skip the per-type models.
+TYPE_HOTSPOT_PARTITION = "Primary Type"
+
+
+def _single_hotspot(geo: FeatureMatrix, scaled: np.ndarray) -> dict:
+    return {
+        "labels": np.zeros(len(scaled), dtype=int),
+        "centroids": geo.inverse_transform(scaled.mean(axis=0, keepdims=True)),
+        "k": 1, "silhouette": np.nan, "davies_bouldin": np.nan
+    }
+
+
+def fit_partition_hotspots(geo: FeatureMatrix, rows: np.ndarray, k_range=range(2, 9),
+                           sample_size: int = 3000, min_size: int = 50) -> dict:
+    """
+    Fit a hotspot model for one partition, choosing k by silhouette score.
+
+    Partitions that are too small, or whose incidents share too few
+    distinct locations to split, get a single hotspot.
+    """
+    scaled = geo.X[rows]
+    if len(scaled) < min_size:
+        return _single_hotspot(geo, scaled)
+
+    rng = np.random.default_rng(42)
+    sample = scaled[rng.choice(len(scaled), min(sample_size, len(scaled)), replace=False)]
+    n_distinct = len(np.unique(sample, axis=0))
+
+    best_k, best_sil = None, -1.0
+    for k in k_range:
+        if k > n_distinct:
+            break
+        labels = MiniBatchKMeans(
+            n_clusters=k, batch_size=5000, random_state=42, n_init=3
+        ).fit_predict(sample)
+        if len(np.unique(labels)) < 2:
+            continue
+        sil = silhouette_score(sample, labels)
+        if sil > best_sil:
+            best_k, best_sil = k, sil
+
+    if best_k is None:
+        return _single_hotspot(geo, scaled)
+
+    model = MiniBatchKMeans(
+        n_clusters=best_k, batch_size=10000, random_state=42, n_init=3
+    )
+    labels = model.fit_predict(scaled)
+    sample_labels = model.predict(sample)
+    if len(np.unique(sample_labels)) < 2:
+        return _single_hotspot(geo, scaled)
+
+    return {
+        "labels": labels,
+        "centroids": geo.inverse_transform(model.cluster_centers_),
+        "k": best_k,
+        "silhouette": silhouette_score(sample, sample_labels),
+        "davies_bouldin": davies_bouldin_score(sample, sample_labels)
+    }
+
+
+def fit_type_hotspots(df: pd.DataFrame, geo: FeatureMatrix, partition_col: str,
+                      n_jobs: int = None):
+    """
+    Separate hotspot model per partition, fitted in parallel.
+
+    `df` rows line up with the rows of `geo`. Each worker opens the
+    stored matrix read-only and only reads its own partition's rows;
+    partitions are submitted largest first so the wall time is close to
+    that of the largest partition.
+    """
+    partitions = df.groupby(partition_col).indices
+    ordered = sorted(partitions, key=lambda name: -len(partitions[name]))
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        futures = {
+            name: pool.submit(fit_partition_hotspots, geo, partitions[name])
+            for name in ordered
+        }
+        results = {name: f.result() for name, f in futures.items()}
+
+    labels = np.full(len(df), -1, dtype=int)
+    centroid_rows, metric_rows = [], []
+    offset = 0
+
+    for name in ordered:
+        result = results[name]
+        idx = partitions[name]
+        labels[idx] = result["labels"] + offset
+        sizes = np.bincount(result["labels"], minlength=result["k"])
+
+        for local, (lat, lon) in enumerate(result["centroids"]):
+            centroid_rows.append({
+                partition_col: name,
+                "TypeHotspot_Cluster": offset + local,
+                "Local_Cluster": local,
+                "Latitude": lat,
+                "Longitude": lon,
+                "Incidents": int(sizes[local])
+            })
+        metric_rows.append({
+            partition_col: name,
+            "Incidents": len(idx),
+            "Clusters": result["k"],
+            "Silhouette": result["silhouette"],
+            "Davies_Bouldin": result["davies_bouldin"]
+        })
+        offset += result["k"]
+
+    return labels, pd.DataFrame(centroid_rows), pd.DataFrame(metric_rows)
+
 
 def main():
     INPUT_PATH = "data/processed/chicago_crime_features.csv"
     OUTPUT_PATH = "data/processed/chicago_crime_geo_clustered.csv"
+    TYPE_CENTROIDS_PATH = "data/processed/type_hotspot_centroids.csv"
+    TYPE_METRICS_PATH = "data/processed/type_hotspot_metrics.csv"
 
     Path("outputs").mkdir(exist_ok=True)
 
     print("📥 Loading feature-engineered dataset...")
     df = pd.read_csv(INPUT_PATH)
 
-    geo_features = df[["Latitude", "Longitude"]].dropna()
-
     # -----------------------------
-    # SCALE
+    # SCALED MATRIX (shared feature store)
     # -----------------------------
-    scaler = StandardScaler()
-    geo_scaled = scaler.fit_transform(geo_features)
+    geo = load_matrix("geo", source=INPUT_PATH)
+    geo_scaled = geo.X
 
     # -----------------------------
     # SAMPLE FOR ELBOW (CRITICAL FIX)
@@ -64,7 +180,7 @@ def main():
 
     kmeans_labels = kmeans.fit_predict(geo_scaled)
 
-    df = df.loc[geo_features.index]
+    df = df.iloc[geo.rows]
     df["Geo_Cluster"] = kmeans_labels
 
     sil = silhouette_score(geo_scaled[:50000], kmeans_labels[:50000])
@@ -92,6 +208,18 @@ def main():
     plt.savefig("outputs/hierarchical_dendrogram.png")
     plt.close()
 
+    # -----------------------------
+    # PER-TYPE HOTSPOTS
+    # -----------------------------
+    if TYPE_HOTSPOT_PARTITION:
+        print(f"🧩 Fitting per-{TYPE_HOTSPOT_PARTITION} hotspot models in parallel...")
+        type_labels, centroids, metrics = fit_type_hotspots(df, geo, TYPE_HOTSPOT_PARTITION)
+        df["TypeHotspot_Cluster"] = type_labels
+
+        centroids.to_csv(TYPE_CENTROIDS_PATH, index=False)
+        metrics.to_csv(TYPE_METRICS_PATH, index=False)
+        print(f"✅ {len(metrics)} partitions, {len(centroids)} type hotspots")
+
     # -----------------------------
     # SAVE
     # -----------------------------
@@ -0,0 +1,135 @@
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import KMeans
+
+from feature_store import FeatureMatrix, load_matrix
+
+
+# Feature-store matrix -> number of clusters, matching the geographic
+# and temporal clustering stages
+MODELS = {"geo": 6, "temporal": 4}
+WINDOW_FREQS = {"monthly": "M", "quarterly": "Q"}
+
+
+def fit_window_segment(matrix: FeatureMatrix, segment: list,
+                       init_centroids: np.ndarray) -> list:
+    """
+    Fit consecutive windows in order, warm-starting each from the previous one.
+    """
+    results = []
+    centroids = init_centroids
+    k = len(init_centroids)
+
+    for window, rows in segment:
+        X = matrix.X[rows]
+        if len(X) < k:
+            continue
+        model = KMeans(n_clusters=k, init=centroids, n_init=1, max_iter=100)
+        model.fit(X)
+        centroids = model.cluster_centers_
+        results.append({
+            "window": window,
+            "centroids": centroids,
+            "sizes": np.bincount(model.labels_, minlength=k),
+            "iterations": model.n_iter_
+        })
+
+    return results
+
+
+def align_clusters(windows: list, reference: np.ndarray) -> list:
+    """
+    Relabel each window so cluster i matches cluster i of the previous window.
+    """
+    previous = reference
+    for result in windows:
+        cost = np.linalg.norm(
+            previous[:, None, :] - result["centroids"][None, :, :], axis=2
+        )
+        _, order = linear_sum_assignment(cost)
+        result["centroids"] = result["centroids"][order]
+        result["sizes"] = result["sizes"][order]
+        previous = result["centroids"]
+    return windows
+
+
+def backfill_model(matrix: FeatureMatrix, periods: pd.Series, k: int, n_jobs: int) -> list:
+    """
+    Fit one model per time window; contiguous runs of windows go to each worker.
+
+    Workers get row indices only and read them from the stored matrix.
+    """
+    X = matrix.X
+    rng = np.random.default_rng(42)
+    sample = X[rng.choice(len(X), min(50000, len(X)), replace=False)]
+    reference = KMeans(n_clusters=k, random_state=42, n_init=10).fit(sample).cluster_centers_
+
+    rows_by_window = periods.groupby(periods).indices
+    windows = sorted(rows_by_window)
+    segments = [
+        [(w, rows_by_window[w]) for w in chunk]
+        for chunk in np.array_split(np.array(windows, dtype=object), n_jobs)
+        if len(chunk)
+    ]
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        futures = [pool.submit(fit_window_segment, matrix, seg, reference) for seg in segments]
+        results = [r for f in futures for r in f.result()]
+
+    return align_clusters(results, reference)
+
+
+def trajectory_table(results: list, matrix: FeatureMatrix, freq_name: str) -> pd.DataFrame:
+    rows = []
+    for result in results:
+        centroids = matrix.inverse_transform(result["centroids"])
+        for hotspot, (centre, size) in enumerate(zip(centroids, result["sizes"])):
+            rows.append({
+                "Model": matrix.name,
+                "Window_Freq": freq_name,
+                "Window": str(result["window"]),
+                "Window_Start": result["window"].start_time.date(),
+                "Hotspot_ID": hotspot,
+                **dict(zip(matrix.columns, centre)),
+                "Incidents": int(size),
+                "Iterations": result["iterations"]
+            })
+    return pd.DataFrame(rows)
+
+
+def main():
+    INPUT_PATH = "data/processed/chicago_crime_features.csv"
+    OUTPUT_PATH = "data/processed/hotspot_trajectories.csv"
+
+    N_JOBS = os.cpu_count()
+
+    print("📥 Loading incident dates...")
+    dates = pd.read_csv(INPUT_PATH, usecols=["Date"], parse_dates=["Date"])["Date"]
+
+    tables = []
+    for model_name, k in MODELS.items():
+        matrix = load_matrix(model_name, source=INPUT_PATH)
+        window_dates = dates.iloc[matrix.rows].reset_index(drop=True)
+
+        for freq_name, freq in WINDOW_FREQS.items():
+            periods = window_dates.dt.to_period(freq)
+            print(f"📆 {model_name} backfill over {periods.nunique()} {freq_name} windows...")
+
+            results = backfill_model(matrix, periods, k, N_JOBS)
+            tables.append(trajectory_table(results, matrix, freq_name))
+
+    trajectories = pd.concat(tables, ignore_index=True)
+
+    Path("data/processed").mkdir(exist_ok=True)
+    trajectories.to_csv(OUTPUT_PATH, index=False)
+    print(f"✅ {len(trajectories):,} centroid positions saved")
+    print("💾 Hotspot backfill completed")
+    print(f"📁 Output saved to: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+HOURS_PER_WEEK = 168
+
+# Grid of smoothing parameters tried in every backtest fold
+ALPHAS = [0.05, 0.1, 0.2, 0.3, 0.5]     # EWMA weight of the latest week
+KAPPAS = [5, 20, 50, 200]               # pseudo-counts pulling a cell's profile to the city profile
+
+
+def build_events(df: pd.DataFrame, cell_mode: str, cell_deg: float):
+    """
+    Integer (cell, hour-of-week, week) codes for every incident, plus cell metadata.
+
+    Weeks are counted back from the day after the last incident, so the
+    most recent week is always complete.
+    """
+    if cell_mode == "geo_cluster":
+        cell_codes, cells = pd.factorize(df["Geo_Cluster"], sort=True)
+        centres = df.groupby(cell_codes)[["Latitude", "Longitude"]].mean().to_numpy()
+        cell_ids = [str(c) for c in cells]
+    else:
+        ix = np.floor(df["Longitude"].to_numpy() / cell_deg).astype(np.int64)
+        iy = np.floor(df["Latitude"].to_numpy() / cell_deg).astype(np.int64)
+        cell_codes, cells = pd.factorize(pd.MultiIndex.from_arrays([iy, ix]))
+        centres = np.array([((y + 0.5) * cell_deg, (x + 0.5) * cell_deg) for y, x in cells])
+        cell_ids = [f"{y}_{x}" for y, x in cells]
+
+    day_index = df["Day_of_Week"].map({d: i for i, d in enumerate(DAY_NAMES)}).to_numpy()
+    how = day_index * 24 + df["Hour"].to_numpy()
+
+    end = df["Date"].max().normalize() + pd.Timedelta(days=1)
+    weeks_back = ((end - df["Date"]).dt.days // 7).to_numpy()
+    n_weeks = int(weeks_back.max()) + 1
+    week = n_weeks - 1 - weeks_back
+
+    # Calendar month of every week (history plus the forecast week), from Month
+    week_month = np.ones(n_weeks + 1, dtype=int)
+    month_mode = pd.Series(df["Month"].to_numpy()).groupby(week).agg(lambda m: m.mode()[0])
+    week_month[month_mode.index] = month_mode.to_numpy()
+    week_month[n_weeks] = (end + pd.Timedelta(days=3)).month
+
+    severity = (
+        pd.Series(df["Crime_Severity_Score"].to_numpy())
+        .groupby(cell_codes).mean().reindex(range(len(cell_ids)), fill_value=1).to_numpy()
+    )
+
+    events = {
+        "cell": cell_codes.astype(np.int64),
+        "how": how.astype(np.int64),
+        "week": week.astype(np.int64),
+        "week_month": week_month,
+        "n_cells": len(cell_ids)
+    }
+    meta = pd.DataFrame({
+        "Cell": cell_ids,
+        "Latitude": centres[:, 0],
+        "Longitude": centres[:, 1],
+        "Mean_Severity": severity
+    })
+    return events, meta, end
+
+
+def fit_forecast(events: dict, cutoff: int, alphas, kappas, profile_weeks: int = 52):
+    """
+    Components of the expected counts for week `cutoff`, for all cells at once.
+
+    λ[c, h] = level[c] × profile[c, h]: the level is an EWMA of the
+    cell's deseasonalised weekly totals, reseasonalised with the month
+    index of the target week; the profile is the cell's hour-of-week
+    share shrunk towards the city-wide profile. Returns a level vector
+    per alpha and a (cells × 168) profile per kappa, so a parameter grid
+    costs one product per pair instead of one fit.
+    """
+    n_cells = events["n_cells"]
+    train = events["week"] < cutoff
+    cell, how, week = events["cell"][train], events["how"][train], events["week"][train]
+    week_month = events["week_month"]
+
+    weekly = np.bincount(cell * cutoff + week, minlength=n_cells * cutoff)
+    weekly = weekly.reshape(n_cells, cutoff).astype(np.float64)
+
+    # Month seasonal index from the city-wide weekly totals
+    city = weekly.sum(axis=0)
+    season = np.ones(13)
+    for m in np.unique(week_month[:cutoff]):
+        season[m] = city[week_month[:cutoff] == m].mean() / city.mean()
+    deseasonalised = weekly / season[week_month[:cutoff]]
+
+    recent = week >= cutoff - profile_weeks
+    hourly = np.bincount(
+        cell[recent] * HOURS_PER_WEEK + how[recent], minlength=n_cells * HOURS_PER_WEEK
+    ).reshape(n_cells, HOURS_PER_WEEK).astype(np.float64)
+    city_profile = hourly.sum(axis=0) / max(hourly.sum(), 1)
+    cell_totals = hourly.sum(axis=1, keepdims=True)
+
+    ages = cutoff - 1 - np.arange(cutoff)
+    levels = {}
+    for alpha in alphas:
+        weights = alpha * (1 - alpha) ** ages
+        levels[alpha] = deseasonalised @ (weights / weights.sum()) * season[week_month[cutoff]]
+
+    profiles = {
+        kappa: (hourly + kappa * city_profile) / (cell_totals + kappa)
+        for kappa in kappas
+    }
+    return levels, profiles
+
+
+def poisson_deviance(counts: np.ndarray, expected_at_counts: np.ndarray,
+                     expected_total: float, n_cells: int) -> float:
+    """
+    Mean Poisson deviance over all cells, from the non-zero observations only.
+
+    Zero cells contribute just their expected count, so the full grid
+    reduces to Σμ plus a sum over the observed cells.
+    """
+    expected_at_counts = np.maximum(expected_at_counts, 1e-9)
+    observed = np.sum(counts * np.log(counts / expected_at_counts) - counts)
+    return float(2 * (observed + expected_total) / n_cells)
+
+
+_EVENTS = {}
+
+
+def _init_worker(events):
+    _EVENTS.update(events)
+
+
+def backtest_fold(cutoff: int) -> dict:
+    """
+    Score every parameter pair, and a last-4-weeks mean, on one held-out week.
+    """
+    n_cells = _EVENTS["n_cells"]
+    n_grid = n_cells * HOURS_PER_WEEK
+    codes = _EVENTS["cell"] * HOURS_PER_WEEK + _EVENTS["how"]
+
+    target, counts = np.unique(codes[_EVENTS["week"] == cutoff], return_counts=True)
+    cell, how = np.divmod(target, HOURS_PER_WEEK)
+
+    levels, profiles = fit_forecast(_EVENTS, cutoff, ALPHAS, KAPPAS)
+    scores = {
+        (alpha, kappa): poisson_deviance(
+            counts, levels[alpha][cell] * profiles[kappa][cell, how],
+            levels[alpha].sum(), n_grid
+        )
+        for alpha, kappa in product(ALPHAS, KAPPAS)
+    }
+
+    last4 = (_EVENTS["week"] >= cutoff - 4) & (_EVENTS["week"] < cutoff)
+    naive = np.bincount(codes[last4], minlength=n_grid) / 4
+    scores["naive_4_week_mean"] = poisson_deviance(counts, naive[target], naive.sum(), n_grid)
+    return scores
+
+
+def backtest(events: dict, n_folds: int, n_jobs: int) -> pd.DataFrame:
+    n_weeks = len(events["week_month"]) - 1
+    cutoffs = list(range(n_weeks - n_folds, n_weeks))
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=_init_worker, initargs=(events,)
+    ) as pool:
+        results = list(pool.map(backtest_fold, cutoffs))
+
+    return pd.DataFrame(results, index=cutoffs).mean().rename("Mean_Deviance")
+
+
+def main():
+    INPUT_PATH = "data/processed/chicago_crime_geo_clustered.csv"
+    HOURLY_OUTPUT = "data/processed/hotspot_forecast_hourly.csv"
+    CELL_OUTPUT = "data/processed/hotspot_forecast_cells.csv"
+
+    CELL_MODE = "grid"      # or "geo_cluster"
+    CELL_DEG = 0.01
+    N_FOLDS = 8
+    N_JOBS = os.cpu_count()
+
+    print("📥 Loading clustered dataset...")
+    columns = [
+        "Date", "Latitude", "Longitude", "Hour", "Day_of_Week",
+        "Month", "Crime_Severity_Score", "Geo_Cluster"
+    ]
+    df = pd.read_csv(INPUT_PATH, usecols=columns, parse_dates=["Date"]).dropna()
+
+    events, meta, forecast_start = build_events(df, CELL_MODE, CELL_DEG)
+    n_weeks = len(events["week_month"]) - 1
+    print(f"🧮 {events['n_cells']:,} cells × {HOURS_PER_WEEK} hours-of-week × {n_weeks} weeks")
+
+    # -----------------------------
+    # Backtest (folds in parallel)
+    # -----------------------------
+    print(f"🔁 Backtesting {N_FOLDS} weekly folds...")
+    scores = backtest(events, N_FOLDS, N_JOBS)
+    model_scores = scores.drop("naive_4_week_mean")
+    alpha, kappa = model_scores.idxmin()
+    print(f"✅ Best alpha={alpha}, kappa={kappa}: deviance {model_scores.min():.4f} "
+          f"(4-week mean baseline {scores['naive_4_week_mean']:.4f})")
+
+    # -----------------------------
+    # Forecast next week / next day
+    # -----------------------------
+    levels, profiles = fit_forecast(events, n_weeks, [alpha], [kappa])
+    expected = levels[alpha][:, None] * profiles[kappa]
+
+    hourly = meta[["Cell", "Latitude", "Longitude"]].loc[
+        np.repeat(np.arange(len(meta)), HOURS_PER_WEEK)
+    ].reset_index(drop=True)
+    hours_of_week = np.tile(np.arange(HOURS_PER_WEEK), len(meta))
+    hourly["Day_of_Week"] = np.array(DAY_NAMES)[hours_of_week // 24]
+    hourly["Hour"] = hours_of_week % 24
+    hourly["Expected_Incidents"] = expected.ravel().round(4)
+
+    next_day = forecast_start.dayofweek
+    cells = meta.copy()
+    cells["Expected_Next_Day"] = expected[:, next_day * 24:(next_day + 1) * 24].sum(axis=1)
+    cells["Expected_Next_Week"] = expected.sum(axis=1)
+    cells["Expected_Severity_Next_Week"] = cells["Expected_Next_Week"] * cells["Mean_Severity"]
+    cells["Forecast_Start"] = forecast_start.date()
+    cells = cells.sort_values("Expected_Severity_Next_Week", ascending=False).round(4)
+
+    Path("data/processed").mkdir(exist_ok=True)
+    hourly.to_csv(HOURLY_OUTPUT, index=False)
+    cells.to_csv(CELL_OUTPUT, index=False)
+    print("💾 Hotspot forecast completed")
+    print(f"📁 Output saved to: {CELL_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
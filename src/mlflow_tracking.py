@@ -1,30 +1,25 @@
 import mlflow
 import mlflow.sklearn
-import pandas as pd
 import numpy as np
 
 from sklearn.cluster import MiniBatchKMeans, KMeans, DBSCAN
-from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import silhouette_score, davies_bouldin_score
 from sklearn.decomposition import PCA
 from sklearn.manifold import TSNE
 from scipy.cluster.hierarchy import linkage
 
+from feature_store import load_matrix
+
 # -------------------------------------------------
-# LOAD DATA
+# LOAD DATA (scaled matrices from the shared feature store)
 # -------------------------------------------------
-GEO_PATH = "data/processed/chicago_crime_geo_clustered.csv"
-FEATURE_PATH = "data/processed/chicago_crime_features.csv"
-
-geo_df = pd.read_csv(GEO_PATH)
-feature_df = pd.read_csv(FEATURE_PATH)
+X_geo = load_matrix("geo").X
+X_temp = load_matrix("temporal").X
+X_pca = load_matrix("pca").X
 
 # =================================================
 # 1️⃣ GEOGRAPHIC CLUSTERING – KMEANS
 # =================================================
-X_geo = geo_df[["Latitude", "Longitude"]].dropna()
-X_geo = StandardScaler().fit_transform(X_geo)
-
 mlflow.set_experiment("PatrolIQ_Geographic_KMeans")
 
 for k in [4, 5, 6]:
@@ -87,9 +82,6 @@ with mlflow.start_run(run_name="Hierarchical_Ward"):
 # =================================================
 # 4️⃣ TEMPORAL CLUSTERING – KMEANS
 # =================================================
-X_temp = feature_df[["Hour", "Month", "Is_Weekend"]]
-X_temp = StandardScaler().fit_transform(X_temp)
-
 mlflow.set_experiment("PatrolIQ_Temporal_KMeans")
 
 for k in [3, 4, 5]:
@@ -108,15 +100,6 @@ for k in [3, 4, 5]:
 # =================================================
 # 5️⃣ PCA – DIMENSIONALITY REDUCTION
 # =================================================
-pca_features = [
-    "Latitude", "Longitude",
-    "Hour", "Month",
-    "Is_Weekend", "Crime_Severity_Score"
-]
-
-X_pca = geo_df[pca_features].dropna()
-X_pca = StandardScaler().fit_transform(X_pca)
-
 mlflow.set_experiment("PatrolIQ_PCA")
 
 with mlflow.start_run(run_name="PCA_80pct"):
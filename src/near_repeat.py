@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+# Cells above/right of the current one; with the same-cell forward scan
+# every unordered pair of neighbouring cells is visited exactly once.
+HALF_NEIGHBOURS = [(1, -1), (1, 0), (1, 1), (0, 1)]
+
+
+def project_to_meters(lat: np.ndarray, lon: np.ndarray):
+    """
+    Equirectangular projection around the data centroid (accurate at city scale).
+    """
+    lat0 = np.nanmean(lat)
+    lon0 = np.nanmean(lon)
+    x = (lon - lon0) * 111_320 * np.cos(np.radians(lat0))
+    y = (lat - lat0) * 110_540
+    return x, y
+
+
+def _expand(rows: np.ndarray, lo: np.ndarray, hi: np.ndarray):
+    """
+    Turn per-row [lo, hi) index ranges into flat (row, partner) arrays.
+    """
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    i = np.repeat(rows, counts)
+    starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+    j = starts + np.arange(total)
+    return i, j
+
+
+def near_repeat_pairs(x, y, t_seconds, groups, distance_m, window_days,
+                      batch_size=200_000):
+    """
+    Yield batches of (i, j) index pairs within distance_m and window_days.
+
+    Incidents are bucketed on a grid of distance_m cells and sorted by
+    (group, cell, time), so each incident only searches the time window
+    of its own and neighbouring cells.
+    """
+    window = int(window_days * 86_400)
+
+    cx = np.floor(x / distance_m).astype(np.int64)
+    cy = np.floor(y / distance_m).astype(np.int64)
+    cx -= cx.min() - 1
+    cy -= cy.min() - 1
+    n_rows = cy.max() + 2
+    n_cells = (cx.max() + 2) * n_rows
+
+    t = t_seconds - t_seconds.min()
+    span = int(t.max()) + 2 * window + 1
+
+    cell_key = groups * n_cells + cx * n_rows + cy
+    keys = cell_key * span + t
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    for start in range(0, len(order), batch_size):
+        pos = np.arange(start, min(start + batch_size, len(order)))
+        rows = order[pos]
+        pair_i, pair_j = [], []
+
+        # Same cell: later incidents only, so each pair appears once
+        hi = np.searchsorted(sorted_keys, sorted_keys[pos] + window, side="right")
+        i, j = _expand(rows, pos + 1, hi)
+        pair_i.append(i)
+        pair_j.append(j)
+
+        for dx, dy in HALF_NEIGHBOURS:
+            base = (cell_key[rows] + dx * n_rows + dy) * span + t[rows]
+            lo = np.searchsorted(sorted_keys, base - window, side="left")
+            hi = np.searchsorted(sorted_keys, base + window, side="right")
+            i, j = _expand(rows, lo, hi)
+            pair_i.append(i)
+            pair_j.append(j)
+
+        i = np.concatenate(pair_i)
+        j = order[np.concatenate(pair_j)]
+        close = np.hypot(x[i] - x[j], y[i] - y[j]) <= distance_m
+        yield i[close], j[close]
+
+
+def near_repeat_features(df: pd.DataFrame, distance_m: float = 200,
+                         window_days: float = 14, same_type: bool = True) -> pd.DataFrame:
+    """
+    Near-repeat counts and chain IDs for every incident.
+    """
+    x, y = project_to_meters(
+        df["Latitude"].to_numpy(dtype=float),
+        df["Longitude"].to_numpy(dtype=float)
+    )
+    t_seconds = df["Date"].to_numpy(dtype="datetime64[s]").astype(np.int64)
+    if same_type:
+        groups = pd.factorize(df["Primary Type"])[0].astype(np.int64)
+    else:
+        groups = np.zeros(len(df), dtype=np.int64)
+
+    n = len(df)
+    counts = np.zeros(n, dtype=np.int64)
+    labels = np.arange(n)
+    n_pairs = 0
+
+    for i, j in near_repeat_pairs(x, y, t_seconds, groups, distance_m, window_days):
+        n_pairs += len(i)
+        counts += np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+
+        # Merge this batch's edges into the running chain labels
+        graph = coo_matrix(
+            (np.ones(len(i), dtype=np.int8), (labels[i], labels[j])), shape=(n, n)
+        )
+        _, components = connected_components(graph, directed=False)
+        labels = components[labels]
+
+    chain_sizes = np.bincount(labels, minlength=n)
+    in_chain = chain_sizes[labels] > 1
+    chain_ids = np.full(n, -1, dtype=np.int64)
+    chain_ids[in_chain] = pd.factorize(labels[in_chain])[0]
+
+    print(f"   ↳ {n_pairs:,} near-repeat pairs, {chain_ids.max() + 1:,} chains")
+
+    df["Near_Repeat_Count"] = counts
+    df["Near_Repeat_Chain"] = chain_ids
+    df["Near_Repeat_Chain_Size"] = np.where(in_chain, chain_sizes[labels], 1)
+    return df
+
+
+def main():
+    INPUT_PATH = "data/processed/chicago_crime_features.csv"
+    OUTPUT_PATH = "data/processed/chicago_crime_near_repeat.csv"
+
+    DISTANCE_M = 200
+    WINDOW_DAYS = 14
+    SAME_TYPE = True
+
+    print("📥 Loading feature dataset...")
+    df = pd.read_csv(INPUT_PATH, parse_dates=["Date"])
+    df = df.dropna(subset=["Latitude", "Longitude", "Date"]).reset_index(drop=True)
+
+    print(f"🔁 Finding near-repeat pairs (≤{DISTANCE_M} m, ≤{WINDOW_DAYS} days)...")
+    df = near_repeat_features(df, DISTANCE_M, WINDOW_DAYS, SAME_TYPE)
+
+    repeat_share = (df["Near_Repeat_Count"] > 0).mean() * 100
+    print(f"✅ Incidents with a near repeat: {repeat_share:.2f}%")
+
+    df.to_csv(OUTPUT_PATH, index=False)
+    print("💾 Near-repeat analysis completed")
+    print(f"📁 Output saved to: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import json
+import os
+import shutil
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+
+
+PROCESSED_DIR = "data/processed"
+SNAPSHOT_DIR = "data/snapshots"
+POINTER_NAME = "CURRENT"
+
+# Pipeline outputs the dashboard cannot run without
+SNAPSHOT_REQUIRED_FILES = [
+    "chicago_crime_geo_clustered.csv",
+    "chicago_crime_temporal_clustered.csv",
+    "pca_components.csv"
+]
+
+# Outputs of optional stages; pages without them show a warning
+SNAPSHOT_OPTIONAL_FILES = [
+    "tsne_components.csv",
+    "pca_feature_importance.csv",
+    "hotspot_trajectories.csv",
+    "hotspot_forecast_cells.csv",
+    "hotspot_forecast_hourly.csv",
+    "block_risk_index.npz"
+]
+
+SNAPSHOT_FILES = SNAPSHOT_REQUIRED_FILES + SNAPSHOT_OPTIONAL_FILES
+
+Snapshot = namedtuple("Snapshot", ["version", "directory", "data"])
+
+
+def current_version(snapshot_dir: str = SNAPSHOT_DIR):
+    """
+    Version named by the CURRENT pointer, or None before the first publish.
+    """
+    try:
+        return (Path(snapshot_dir) / POINTER_NAME).read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def publish_snapshot(source_dir: str = PROCESSED_DIR, snapshot_dir: str = SNAPSHOT_DIR,
+                     required: list = SNAPSHOT_REQUIRED_FILES,
+                     optional: list = SNAPSHOT_OPTIONAL_FILES, keep: int = 3) -> str:
+    """
+    Copy the pipeline outputs into a new immutable snapshot and point CURRENT at it.
+
+    The snapshot is assembled in a hidden directory and renamed into
+    place, then the pointer is swapped with os.replace, so readers only
+    ever see complete snapshots. Raises FileNotFoundError, leaving
+    CURRENT untouched, if a required output is missing.
+    """
+    missing = [name for name in required if not (Path(source_dir) / name).exists()]
+    if missing:
+        raise FileNotFoundError(
+            f"Required outputs missing from {source_dir}: {', '.join(missing)}"
+        )
+
+    root = Path(snapshot_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    version = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    scratch = root / f".{version}.tmp"
+    scratch.mkdir()
+
+    manifest = {"version": version, "created": datetime.now().isoformat(), "files": {}}
+    try:
+        for name in required + optional:
+            source = Path(source_dir) / name
+            if not source.exists():
+                continue
+            target = scratch / name
+            shutil.copy2(source, target)
+            os.chmod(target, 0o444)
+            manifest["files"][name] = target.stat().st_size
+
+        with open(scratch / "manifest.json", "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        os.rename(scratch, root / version)
+    except BaseException:
+        shutil.rmtree(scratch, ignore_errors=True)
+        raise
+
+    pointer_tmp = root / f".{POINTER_NAME}.tmp"
+    pointer_tmp.write_text(version)
+    os.replace(pointer_tmp, root / POINTER_NAME)
+
+    # Old snapshots are never modified, only removed once out of rotation
+    published = sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith("."))
+    for old in published[:-keep]:
+        shutil.rmtree(old, ignore_errors=True)
+
+    return version
+
+
+class SnapshotManager:
+    """
+    Serves the current snapshot and preloads new ones in a background thread.
+
+    `current()` returns an immutable Snapshot; a script run that holds it
+    keeps a consistent view even if a newer snapshot is swapped in
+    meanwhile. At most two snapshots are resident: the one being served
+    and the one being loaded.
+    """
+
+    def __init__(self, loader, snapshot_dir: str = SNAPSHOT_DIR,
+                 fallback_dir: str = PROCESSED_DIR, poll_seconds: float = 30):
+        self._loader = loader
+        self._snapshot_dir = snapshot_dir
+        self._poll_seconds = poll_seconds
+        self._failed_version = None
+        self._current = self._initial_snapshot(fallback_dir)
+
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+
+    def _initial_snapshot(self, fallback_dir: str) -> Snapshot:
+        """
+        Load CURRENT, else the newest older snapshot that loads, else the fallback directory.
+        """
+        root = Path(self._snapshot_dir)
+        version = current_version(self._snapshot_dir)
+        candidates = []
+        if version is not None:
+            candidates.append((version, str(root / version)))
+            older = sorted(
+                (p.name for p in root.iterdir()
+                 if p.is_dir() and not p.name.startswith(".") and p.name != version),
+                reverse=True
+            )
+            candidates += [(name, str(root / name)) for name in older]
+        # Nothing published (or nothing loadable): serve the processed outputs directly
+        candidates.append(("processed", fallback_dir))
+
+        for candidate, directory in candidates:
+            try:
+                return Snapshot(candidate, directory, self._loader(directory))
+            except Exception as err:
+                if candidate == "processed":
+                    raise
+                if candidate == version:
+                    self._failed_version = version
+                print(f"⚠️ Could not load snapshot {candidate}: {err}")
+
+    def current(self) -> Snapshot:
+        return self._current
+
+    def _watch(self):
+        while True:
+            time.sleep(self._poll_seconds)
+            version = current_version(self._snapshot_dir)
+            if version in (None, self._current.version, self._failed_version):
+                continue
+
+            directory = str(Path(self._snapshot_dir) / version)
+            try:
+                data = self._loader(directory)
+            except Exception as err:
+                # Not retried until CURRENT points somewhere else
+                self._failed_version = version
+                print(f"⚠️ Could not load snapshot {version}: {err}")
+                continue
+
+            # Single reference assignment: readers see the old or the new snapshot
+            self._current = Snapshot(version, directory, data)
+            print(f"🔄 Switched to snapshot {version}")
+
+
+def main():
+    print(f"📦 Publishing snapshot from {PROCESSED_DIR}...")
+    version = publish_snapshot()
+    print("💾 Snapshot published")
+    print(f"📁 Output: {Path(SNAPSHOT_DIR) / version}")
+
+
+if __name__ == "__main__":
+    main()
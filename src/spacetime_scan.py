@@ -0,0 +1,252 @@
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from scipy.spatial import cKDTree
+
+
+def build_zones(lat: np.ndarray, lon: np.ndarray, cell_deg: float):
+    """
+    Grid incidents into zones; returns (zone index per incident, zone centres).
+    """
+    ix = np.floor(lon / cell_deg).astype(np.int64)
+    iy = np.floor(lat / cell_deg).astype(np.int64)
+    cell_codes, cells = pd.factorize(pd.MultiIndex.from_arrays([ix, iy]))
+    centres = np.array(
+        [((x + 0.5) * cell_deg, (y + 0.5) * cell_deg) for x, y in cells]
+    )
+    return cell_codes, centres
+
+
+def nearest_zones(centres: np.ndarray, max_zones: int, max_radius_m: float):
+    """
+    K nearest zones around every centre, plus a mask of those within the radius.
+    """
+    lat0 = np.radians(centres[:, 1].mean())
+    xy = np.column_stack([
+        centres[:, 0] * 111_320 * np.cos(lat0),
+        centres[:, 1] * 110_540
+    ])
+    k = min(max_zones, len(centres))
+    dist, neighbours = cKDTree(xy).query(xy, k=k)
+    dist = dist.reshape(len(centres), k)
+    neighbours = neighbours.reshape(len(centres), k)
+    return neighbours, dist, dist <= max_radius_m
+
+
+def scan(counts, neighbours, valid, zone_totals, day_totals, max_days,
+         keep_windows=False, batch=128):
+    """
+    Best log-likelihood ratio over all cylinders (centre, k zones, time window).
+
+    Expected counts only depend on zone and day totals, which permutation
+    preserves, so they are identical for the observed data and every replicate.
+    """
+    total = zone_totals.sum()
+    n_zones, n_days = counts.shape
+    day_prefix = np.concatenate([[0], np.cumsum(day_totals)])
+
+    best = {
+        "llr": np.zeros(n_zones), "k": np.zeros(n_zones, dtype=int),
+        "start": np.zeros(n_zones, dtype=int), "length": np.zeros(n_zones, dtype=int),
+        "observed": np.zeros(n_zones), "expected": np.zeros(n_zones)
+    }
+
+    for b in range(0, n_zones, batch):
+        nbrs = neighbours[b:b + batch]
+        rows = np.arange(len(nbrs))
+
+        # Cumulative over neighbour rank, then prefix sums over days.
+        # float32 is exact for counts below 2**24 and halves the work.
+        cylinder = np.cumsum(counts[nbrs], axis=1, dtype=np.float32)
+        prefix = np.concatenate(
+            [np.zeros(cylinder.shape[:2] + (1,), dtype=np.float32),
+             np.cumsum(cylinder, axis=2)], axis=2
+        )
+        zone_mass = np.cumsum(zone_totals[nbrs], axis=1)[:, :, None].astype(np.float32)
+        in_radius = valid[b:b + batch, :, None]
+
+        for length in range(1, min(max_days, n_days) + 1):
+            observed = prefix[:, :, length:] - prefix[:, :, :-length]
+            day_mass = (day_prefix[length:] - day_prefix[:-length])[None, None, :]
+            expected = zone_mass * (day_mass / total).astype(np.float32)
+
+            # Only high-rate cylinders with at least two cases can be clusters
+            high = (observed > expected) & (observed >= 2) & in_radius
+            o = observed[high]
+            e = expected[high]
+            llr = np.zeros(observed.shape, dtype=np.float32)
+            llr[high] = o * np.log(o / e) + (total - o) * np.log1p((e - o) / (total - e))
+
+            flat = llr.reshape(len(nbrs), -1).argmax(axis=1)
+            k_idx, start = np.unravel_index(flat, llr.shape[1:])
+            top = llr[rows, k_idx, start]
+
+            better = top > best["llr"][b:b + batch]
+            if not better.any():
+                continue
+            idx = np.flatnonzero(better) + b
+            best["llr"][idx] = top[better]
+            if keep_windows:
+                best["k"][idx] = k_idx[better] + 1
+                best["start"][idx] = start[better]
+                best["length"][idx] = length
+                best["observed"][idx] = observed[rows, k_idx, start][better]
+                best["expected"][idx] = expected[rows, k_idx, start][better]
+
+    return best
+
+
+# -------------------------------------------------
+# Monte Carlo workers: arrays are sent once per worker
+# -------------------------------------------------
+_SHARED = {}
+
+
+def _init_worker(case_zone, case_day, neighbours, valid, zone_totals, day_totals, max_days):
+    _SHARED.update(
+        case_zone=case_zone, case_day=case_day, neighbours=neighbours, valid=valid,
+        zone_totals=zone_totals, day_totals=day_totals, max_days=max_days
+    )
+
+
+def _replicate_block(seed, n_replicates):
+    rng = np.random.default_rng(seed)
+    n_zones = len(_SHARED["zone_totals"])
+    n_days = len(_SHARED["day_totals"])
+    maxima = np.empty(n_replicates)
+
+    for r in range(n_replicates):
+        # Permuting days across cases keeps both zone and day marginals
+        shuffled = rng.permutation(_SHARED["case_day"])
+        counts = np.bincount(
+            _SHARED["case_zone"] * n_days + shuffled, minlength=n_zones * n_days
+        ).reshape(n_zones, n_days)
+        best = scan(
+            counts, _SHARED["neighbours"], _SHARED["valid"],
+            _SHARED["zone_totals"], _SHARED["day_totals"], _SHARED["max_days"]
+        )
+        maxima[r] = best["llr"].max()
+
+    return maxima
+
+
+def monte_carlo_maxima(case_zone, case_day, neighbours, valid, zone_totals,
+                       day_totals, max_days, n_replicates=999, n_jobs=None, seed=42):
+    n_jobs = n_jobs or os.cpu_count()
+    blocks = np.array_split(np.arange(n_replicates), n_jobs * 4)
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_worker,
+        initargs=(case_zone, case_day, neighbours, valid, zone_totals, day_totals, max_days)
+    ) as pool:
+        futures = [
+            pool.submit(_replicate_block, s, len(block))
+            for s, block in zip(seeds, blocks) if len(block)
+        ]
+        return np.concatenate([f.result() for f in futures])
+
+
+def rank_clusters(best, neighbours, n_clusters):
+    """
+    Most likely cluster first, then secondary clusters with no shared zones.
+    """
+    used = set()
+    selected = []
+    for centre in np.argsort(-best["llr"]):
+        if best["llr"][centre] <= 0 or len(selected) == n_clusters:
+            break
+        zones = set(neighbours[centre, :best["k"][centre]].tolist())
+        if zones & used:
+            continue
+        used |= zones
+        selected.append(centre)
+    return selected
+
+
+def main():
+    INPUT_PATH = "data/processed/chicago_crime_features.csv"
+    OUTPUT_PATH = "data/processed/spacetime_scan_clusters.csv"
+
+    SCAN_DAYS = 365
+    CELL_DEG = 0.01
+    MAX_ZONES = 15
+    MAX_RADIUS_M = 3000
+    MAX_WINDOW_DAYS = 7
+    N_REPLICATES = 999
+    N_CLUSTERS = 10
+
+    print("📥 Loading feature dataset...")
+    df = pd.read_csv(INPUT_PATH, usecols=["Date", "Latitude", "Longitude"], parse_dates=["Date"])
+    df = df.dropna()
+    df = df[df["Date"] > df["Date"].max() - pd.Timedelta(days=SCAN_DAYS)]
+
+    # -----------------------------
+    # Zone × day count grid
+    # -----------------------------
+    case_zone, centres = build_zones(
+        df["Latitude"].to_numpy(), df["Longitude"].to_numpy(), CELL_DEG
+    )
+    start_day = df["Date"].min().normalize()
+    case_day = ((df["Date"] - start_day).dt.days).to_numpy()
+    n_zones, n_days = len(centres), case_day.max() + 1
+
+    counts = np.bincount(
+        case_zone * n_days + case_day, minlength=n_zones * n_days
+    ).reshape(n_zones, n_days).astype(float)
+    zone_totals = counts.sum(axis=1)
+    day_totals = counts.sum(axis=0)
+    print(f"🧮 {len(df):,} incidents over {n_zones} zones × {n_days} days")
+
+    neighbours, dist, valid = nearest_zones(centres, MAX_ZONES, MAX_RADIUS_M)
+
+    # -----------------------------
+    # Observed scan
+    # -----------------------------
+    print("🔎 Scanning space-time cylinders...")
+    best = scan(
+        counts, neighbours, valid, zone_totals, day_totals,
+        MAX_WINDOW_DAYS, keep_windows=True
+    )
+
+    # -----------------------------
+    # Monte Carlo significance
+    # -----------------------------
+    print(f"🎲 Running {N_REPLICATES} permutation replicates...")
+    maxima = monte_carlo_maxima(
+        case_zone, case_day, neighbours, valid, zone_totals, day_totals,
+        MAX_WINDOW_DAYS, n_replicates=N_REPLICATES
+    )
+
+    rows = []
+    for rank, centre in enumerate(rank_clusters(best, neighbours, N_CLUSTERS), start=1):
+        k = best["k"][centre]
+        window_start = start_day + pd.Timedelta(days=int(best["start"][centre]))
+        rows.append({
+            "Rank": rank,
+            "Center_Latitude": centres[centre, 1],
+            "Center_Longitude": centres[centre, 0],
+            "Radius_m": dist[centre, k - 1],
+            "Zones": k,
+            "Start_Date": window_start.date(),
+            "End_Date": (window_start + pd.Timedelta(days=int(best["length"][centre]) - 1)).date(),
+            "Observed": int(best["observed"][centre]),
+            "Expected": best["expected"][centre],
+            "Relative_Risk": best["observed"][centre] / best["expected"][centre],
+            "LLR": best["llr"][centre],
+            "P_Value": (1 + np.sum(maxima >= best["llr"][centre])) / (N_REPLICATES + 1)
+        })
+
+    clusters = pd.DataFrame(rows)
+    clusters.to_csv(OUTPUT_PATH, index=False)
+
+    significant = (clusters["P_Value"] < 0.05).sum() if len(clusters) else 0
+    print(f"✅ {significant} significant space-time clusters (p < 0.05)")
+    print("💾 Space-time scan completed")
+    print(f"📁 Output saved to: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
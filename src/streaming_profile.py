@@ -0,0 +1,347 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+EXACT_FIELDS = [
+    "Primary Type",
+    "Arrest",
+    "Domestic",
+    "Year",
+    "District",
+    "FBI Code",
+    "Hour"
+]
+HEAVY_HITTER_FIELDS = ["Block", "Description"]
+DISTINCT_FIELDS = [
+    "ID",
+    "Block",
+    "Description",
+    "Location Description",
+    "Beat",
+    "IUCR"
+]
+QUANTILE_LEVELS = [0.5, 0.75, 0.9, 0.95, 0.99]
+PORTAL_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Deterministic 64-bit hashes, identical across processes and runs.
+    """
+    return pd.util.hash_array(values.astype(str).to_numpy(dtype=object))
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse raw portal timestamps, falling back to ISO for cleaned files.
+    """
+    parsed = pd.to_datetime(values, format=PORTAL_DATE_FORMAT, errors="coerce")
+    if parsed.isna().all():
+        parsed = pd.to_datetime(values, format="ISO8601", errors="coerce")
+    return parsed
+
+
+# =================================================
+# SKETCHES
+# =================================================
+class ExactCounter:
+    """
+    Exact value counts for low-cardinality fields.
+    """
+
+    def __init__(self):
+        self.counts = pd.Series(dtype="int64")
+
+    def update(self, values: pd.Series):
+        chunk_counts = values.astype(str).value_counts()
+        self.counts = self.counts.add(chunk_counts, fill_value=0).astype("int64")
+
+    def merge(self, other: "ExactCounter"):
+        self.counts = self.counts.add(other.counts, fill_value=0).astype("int64")
+
+    def to_dict(self) -> dict:
+        counts = self.counts.sort_values(ascending=False)
+        return {str(k): int(v) for k, v in counts.items()}
+
+
+class CountMinSketch:
+    """
+    Count-min sketch with a bounded candidate list of heavy hitters.
+    """
+
+    def __init__(self, width: int = 2 ** 16, depth: int = 4, capacity: int = 100):
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.candidates = {}
+
+    def _indices(self, hashes: np.ndarray) -> np.ndarray:
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = hashes >> np.uint64(32)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1[None, :] + rows * h2[None, :]) % np.uint64(self.width)).astype(np.int64)
+
+    def _estimate(self, keys: list) -> np.ndarray:
+        idx = self._indices(hash_values(pd.Series(keys)))
+        return self.table[np.arange(self.depth)[:, None], idx].min(axis=0)
+
+    def _refresh_candidates(self, keys):
+        keys = list(keys)
+        if not keys:
+            return
+        estimates = self._estimate(keys)
+        order = np.argsort(-estimates)[: self.capacity]
+        self.candidates = {keys[i]: int(estimates[i]) for i in order}
+
+    def update(self, values: pd.Series):
+        values = values.astype(str)
+        idx = self._indices(hash_values(values))
+        for row in range(self.depth):
+            self.table[row] += np.bincount(idx[row], minlength=self.width)
+
+        local_top = values.value_counts().head(self.capacity).index
+        self._refresh_candidates(set(self.candidates) | set(local_top))
+
+    def merge(self, other: "CountMinSketch"):
+        self.table += other.table
+        self._refresh_candidates(set(self.candidates) | set(other.candidates))
+
+    def top(self, k: int = 25) -> list:
+        ranked = sorted(self.candidates.items(), key=lambda kv: -kv[1])
+        return [[key, count] for key, count in ranked[:k]]
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count estimator (p=14, ~0.8% standard error).
+    """
+
+    def __init__(self, p: int = 14):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, values: pd.Series):
+        hashes = hash_values(values.dropna())
+        tail_bits = 64 - self.p
+        idx = (hashes >> np.uint64(tail_bits)).astype(np.int64)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # frexp is exact here: the tail fits in the float64 mantissa
+        bit_length = np.frexp(tail.astype(np.float64))[1]
+        rank = (tail_bits + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.m and zeros > 0:
+            raw = self.m * np.log(self.m / zeros)
+        return int(round(raw))
+
+
+class QuantileSketch:
+    """
+    Log-bucketed histogram with bounded relative error (DDSketch-style).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 min_value: float = 1e-3, max_value: float = 1e7):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.offset = int(np.floor(np.log(min_value) / self.log_gamma))
+        n_buckets = int(np.ceil(np.log(max_value) / self.log_gamma)) - self.offset + 1
+        self.buckets = np.zeros(n_buckets, dtype=np.int64)
+        self.min_value = min_value
+        self.zero_count = 0
+        self.negative_count = 0
+
+    def update(self, values: np.ndarray):
+        values = values[~np.isnan(values)]
+        self.negative_count += int(np.count_nonzero(values < 0))
+        values = values[values >= 0]
+        small = values < self.min_value
+        self.zero_count += int(np.count_nonzero(small))
+
+        keys = np.ceil(np.log(values[~small]) / self.log_gamma).astype(np.int64)
+        keys = np.clip(keys - self.offset, 0, len(self.buckets) - 1)
+        self.buckets += np.bincount(keys, minlength=len(self.buckets))
+
+    def merge(self, other: "QuantileSketch"):
+        self.buckets += other.buckets
+        self.zero_count += other.zero_count
+        self.negative_count += other.negative_count
+
+    def quantile(self, q: float) -> float:
+        total = self.zero_count + self.buckets.sum()
+        if total == 0:
+            return float("nan")
+        rank = q * (total - 1)
+        if rank < self.zero_count:
+            return 0.0
+        cumulative = self.zero_count + np.cumsum(self.buckets)
+        key = int(np.searchsorted(cumulative, rank, side="right")) + self.offset
+        return float(2 * self.gamma ** key / (self.gamma + 1))
+
+
+# =================================================
+# CHUNK PROFILE
+# =================================================
+class CrimeProfile:
+    """
+    Mergeable collection of sketches for one or more data chunks.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.exact = {col: ExactCounter() for col in EXACT_FIELDS}
+        self.heavy = {col: CountMinSketch() for col in HEAVY_HITTER_FIELDS}
+        self.distinct = {col: HyperLogLog() for col in DISTINCT_FIELDS}
+        self.report_lag = QuantileSketch()
+        self.date_min = None
+        self.date_max = None
+
+    def update(self, chunk: pd.DataFrame):
+        self.rows += len(chunk)
+
+        dates = parse_dates(chunk["Date"])
+        chunk = chunk.assign(Hour=dates.dt.hour.astype("Int64").astype("string"))
+        for col in ["Arrest", "Domestic"]:
+            if col in chunk.columns:
+                chunk[col] = (
+                    chunk[col].astype(str).str.strip().str.lower()
+                    .map({"true": "True", "false": "False"})
+                    .fillna("UNKNOWN")
+                )
+
+        for col, sketch in self.exact.items():
+            if col in chunk.columns:
+                sketch.update(chunk[col].fillna("UNKNOWN"))
+        for col, sketch in self.heavy.items():
+            if col in chunk.columns:
+                sketch.update(chunk[col].fillna("UNKNOWN"))
+        for col, sketch in self.distinct.items():
+            if col in chunk.columns:
+                sketch.update(chunk[col])
+
+        # Reporting lag: hours between the incident and its last update
+        if "Updated On" in chunk.columns:
+            updated = parse_dates(chunk["Updated On"])
+            lag_hours = (updated - dates).dt.total_seconds() / 3600
+            self.report_lag.update(lag_hours.to_numpy(dtype=np.float64, na_value=np.nan))
+
+        self._update_range(dates.min(), dates.max())
+
+    def _update_range(self, lo, hi):
+        if pd.notna(lo):
+            self.date_min = lo if self.date_min is None else min(self.date_min, lo)
+        if pd.notna(hi):
+            self.date_max = hi if self.date_max is None else max(self.date_max, hi)
+
+    def merge(self, other: "CrimeProfile") -> "CrimeProfile":
+        self.rows += other.rows
+        for col in self.exact:
+            self.exact[col].merge(other.exact[col])
+        for col in self.heavy:
+            self.heavy[col].merge(other.heavy[col])
+        for col in self.distinct:
+            self.distinct[col].merge(other.distinct[col])
+        self.report_lag.merge(other.report_lag)
+        self._update_range(other.date_min, other.date_max)
+        return self
+
+    def summary(self, source: str) -> dict:
+        return {
+            "source": source,
+            "rows": self.rows,
+            "date_min": None if self.date_min is None else str(self.date_min),
+            "date_max": None if self.date_max is None else str(self.date_max),
+            "exact_counts": {
+                col: sketch.to_dict() for col, sketch in self.exact.items()
+            },
+            "heavy_hitters": {
+                col: sketch.top() for col, sketch in self.heavy.items()
+            },
+            "distinct_estimates": {
+                col: sketch.estimate() for col, sketch in self.distinct.items()
+            },
+            "time_gap_quantiles": {
+                "report_lag_hours": {
+                    f"p{int(q * 100)}": self.report_lag.quantile(q)
+                    for q in QUANTILE_LEVELS
+                },
+                "negative_report_lags": self.report_lag.negative_count
+            }
+        }
+
+
+def profile_chunk(chunk: pd.DataFrame) -> CrimeProfile:
+    profile = CrimeProfile()
+    profile.update(chunk)
+    return profile
+
+
+def profile_csv(path: str, chunksize: int = 250_000, n_jobs: int = 4) -> CrimeProfile:
+    """
+    Single chunked pass over a crime CSV, sketching chunks in a process pool.
+    """
+    needed = set(EXACT_FIELDS + HEAVY_HITTER_FIELDS + DISTINCT_FIELDS + ["Date", "Updated On"])
+    reader = pd.read_csv(
+        path,
+        chunksize=chunksize,
+        usecols=lambda c: c in needed,
+        dtype=str
+    )
+
+    merged = CrimeProfile()
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        pending = set()
+        rows_read = 0
+        for i, chunk in enumerate(reader):
+            # Bound in-flight chunks so memory stays flat on the full history
+            if len(pending) >= 2 * n_jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merged.merge(future.result())
+            pending.add(pool.submit(profile_chunk, chunk))
+            rows_read += len(chunk)
+            print(f"   ↳ chunk {i + 1} submitted ({rows_read:,} rows read)")
+
+        for future in pending:
+            merged.merge(future.result())
+
+    return merged
+
+
+def main():
+    RAW_PATH = "data/raw/chicago_crime_raw.csv"
+    CLEANED_PATH = "data/processed/chicago_crime_cleaned.csv"
+    OUTPUT_PATH = "data/processed/eda_summary.json"
+
+    Path("data/processed").mkdir(parents=True, exist_ok=True)
+
+    input_path = RAW_PATH if Path(RAW_PATH).exists() else CLEANED_PATH
+    print(f"📥 Streaming profile of {input_path}...")
+
+    profile = profile_csv(input_path)
+    summary = profile.summary(source=input_path)
+
+    with open(OUTPUT_PATH, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"✅ Profiled {summary['rows']:,} rows")
+    print(f"✅ Distinct blocks (est.): {summary['distinct_estimates']['Block']:,}")
+    print("💾 Streaming profile completed successfully")
+    print(f"📁 Output: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
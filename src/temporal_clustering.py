@@ -1,9 +1,10 @@
 import pandas as pd
 from pathlib import Path
 from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
 import matplotlib.pyplot as plt
 
+from feature_store import load_matrix
+
 
 def main():
     INPUT_PATH = "data/processed/chicago_crime_features.csv"
@@ -17,10 +18,9 @@ def main():
     # -----------------------------
     # Temporal features
     # -----------------------------
-    temporal_features = df[["Hour", "Month", "Is_Weekend"]]
-
-    scaler = StandardScaler()
-    temporal_scaled = scaler.fit_transform(temporal_features)
+    temporal = load_matrix("temporal", source=INPUT_PATH)
+    temporal_scaled = temporal.X
+    df = df.iloc[temporal.rows]
 
     # -----------------------------
     # Elbow method (sampled)
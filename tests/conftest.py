@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Pipeline modules live in src/ and are run as scripts, so import them flat
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from data_cleaning import (
+    NEAR_DUPLICATE_CONFIG, NEAR_DUPLICATE_TEXT_FIELDS, find_near_duplicates, row_signatures
+)
+
+
+def make_reports(n: int, minutes_apart: int) -> pd.DataFrame:
+    """
+    Identical retail-theft reports at one store, evenly spaced in time.
+    """
+    return pd.DataFrame({
+        "ID": np.arange(1, n + 1),
+        "Date": pd.Timestamp("2024-03-01 09:00") + pd.to_timedelta(
+            np.arange(n) * minutes_apart, unit="min"
+        ),
+        "Primary Type": "THEFT",
+        "Description": "RETAIL THEFT",
+        "Location Description": "DEPARTMENT STORE",
+        "Block": "001XX N STATE ST",
+        "Latitude": 41.8837,
+        "Longitude": -87.6278
+    })
+
+
+def assert_within_limits(df: pd.DataFrame, duplicate_of: np.ndarray):
+    dups = ~np.isnan(duplicate_of)
+    originals = df.set_index("ID").loc[duplicate_of[dups].astype(int)]
+    gaps = df.loc[dups, "Date"].to_numpy() - originals["Date"].to_numpy()
+    assert (gaps >= np.timedelta64(0, "m")).all()
+    assert (gaps <= np.timedelta64(NEAR_DUPLICATE_CONFIG["max_minutes"], "m")).all()
+    # Originals are never themselves duplicates
+    assert np.isnan(duplicate_of[np.isin(df["ID"], duplicate_of[dups])]).all()
+
+
+def test_evenly_spaced_chain_is_not_collapsed():
+    df = make_reports(12, minutes_apart=20)
+    duplicate_of = find_near_duplicates(df, NEAR_DUPLICATE_CONFIG)
+
+    assert_within_limits(df, duplicate_of)
+    # Every other report starts a new group: at most one repeat per original
+    assert np.count_nonzero(~np.isnan(duplicate_of)) == 6
+
+
+def test_chain_wider_than_limit_has_no_duplicates():
+    df = make_reports(12, minutes_apart=NEAR_DUPLICATE_CONFIG["max_minutes"] + 10)
+    duplicate_of = find_near_duplicates(df, NEAR_DUPLICATE_CONFIG)
+
+    assert np.isnan(duplicate_of).all()
+
+
+def test_large_identical_block_stays_within_limits():
+    # Bulk reports dated to the same minute, as with midnight-on-the-1st dates
+    df = make_reports(2000, minutes_apart=0)
+    duplicate_of = find_near_duplicates(df, NEAR_DUPLICATE_CONFIG)
+
+    assert_within_limits(df, duplicate_of)
+    assert np.isnan(duplicate_of[0])
+
+
+def test_adjacent_blocks_are_not_merged():
+    df = make_reports(2, minutes_apart=10)
+    df.loc[1, "Block"] = "002XX N STATE ST"
+    duplicate_of = find_near_duplicates(df, NEAR_DUPLICATE_CONFIG)
+
+    assert np.isnan(duplicate_of).all()
+
+
+def test_different_descriptions_on_same_block_are_not_merged():
+    df = make_reports(2, minutes_apart=10)
+    df.loc[1, "Description"] = "FROM BUILDING"
+    df.loc[1, "Location Description"] = "RESTAURANT"
+    duplicate_of = find_near_duplicates(df, NEAR_DUPLICATE_CONFIG)
+
+    assert np.isnan(duplicate_of).all()
+
+
+def test_unrelated_rows_have_low_estimated_similarity():
+    df = pd.DataFrame({
+        "Description": ["RETAIL THEFT", "AGGRAVATED: HANDGUN"],
+        "Location Description": ["DEPARTMENT STORE", "ALLEY"]
+    })
+    signatures = row_signatures(df, NEAR_DUPLICATE_TEXT_FIELDS, num_perm=256)
+
+    assert (signatures[0] == signatures[1]).mean() < 0.1
@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+from feature_store import load_matrix
+from geographic_clustering import fit_partition_hotspots
+
+
+def test_partition_at_one_location_gets_single_hotspot(tmp_path):
+    # Incidents geocoded to a district station, plus a spread-out partition
+    rng = np.random.default_rng(0)
+    lat = np.r_[np.full(200, 41.88), 41.7 + rng.random(500) * 0.3]
+    lon = np.r_[np.full(200, -87.63), -87.8 + rng.random(500) * 0.2]
+    source = tmp_path / "features.csv"
+    pd.DataFrame({
+        "ID": np.arange(len(lat)), "Latitude": lat, "Longitude": lon,
+        "Hour": 0, "Month": 1, "Is_Weekend": 0, "Crime_Severity_Score": 1
+    }).to_csv(source, index=False)
+    geo = load_matrix("geo", source=str(source), store_dir=str(tmp_path / "store"))
+
+    result = fit_partition_hotspots(geo, np.arange(200))
+
+    assert result["k"] == 1
+    assert (result["labels"] == 0).all()
+    np.testing.assert_allclose(result["centroids"], [[41.88, -87.63]], atol=1e-4)
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from snapshot_store import (
+    POINTER_NAME, SNAPSHOT_REQUIRED_FILES, SnapshotManager, current_version, publish_snapshot
+)
+
+
+def write_outputs(directory, names=SNAPSHOT_REQUIRED_FILES, value=1):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        pd.DataFrame({"value": [value]}).to_csv(directory / name, index=False)
+
+
+def load_required(directory):
+    return {name: pd.read_csv(f"{directory}/{name}") for name in SNAPSHOT_REQUIRED_FILES}
+
+
+def test_publish_refuses_missing_required_outputs(tmp_path):
+    snapshots = tmp_path / "snapshots"
+    write_outputs(tmp_path / "good")
+    version = publish_snapshot(tmp_path / "good", snapshots)
+
+    write_outputs(tmp_path / "partial", names=["pca_components.csv"])
+    with pytest.raises(FileNotFoundError):
+        publish_snapshot(tmp_path / "partial", snapshots)
+
+    assert current_version(snapshots) == version
+    assert [p.name for p in snapshots.iterdir() if p.is_dir()] == [version]
+
+
+def test_manager_falls_back_when_current_fails_to_load(tmp_path):
+    snapshots = tmp_path / "snapshots"
+    write_outputs(tmp_path / "processed", value=0)
+    write_outputs(tmp_path / "good", value=1)
+    previous = publish_snapshot(tmp_path / "good", snapshots)
+
+    # A broken snapshot that CURRENT points at
+    (snapshots / "99999999T999999999999").mkdir()
+    (snapshots / POINTER_NAME).write_text("99999999T999999999999")
+
+    manager = SnapshotManager(
+        load_required, str(snapshots), str(tmp_path / "processed"), poll_seconds=3600
+    )
+    assert manager.current().version == previous
+
+    (snapshots / previous / SNAPSHOT_REQUIRED_FILES[0]).chmod(0o644)
+    (snapshots / previous / SNAPSHOT_REQUIRED_FILES[0]).unlink()
+    manager = SnapshotManager(
+        load_required, str(snapshots), str(tmp_path / "processed"), poll_seconds=3600
+    )
+    assert manager.current().version == "processed"